@@ -1,15 +1,42 @@
-import yfinance as yf
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
 import streamlit as st
 from datetime import datetime
 
 # --- Streamlit Config ---
 st.set_page_config(page_title="DCF Valuation Analysis — Finance Modeling", layout="wide")
 
+# --- Data Fetching (cached per ticker) ---
+@st.cache_data(ttl=3600)
+def _hist(ticker, period):
+    import yfinance as yf
+    return yf.Ticker(ticker).history(period=period)
+
+@st.cache_data(ttl=3600)
+def _statements(ticker):
+    import yfinance as yf
+    stock = yf.Ticker(ticker)
+    return stock.cashflow, stock.financials, stock.balance_sheet
+
+# --- DCF Model ---
+def dcf_core(fcf_raw, wacc, growth_rate, terminal_growth, net_debt, shares_outstanding, market_price):
+    growth_factors = np.cumprod(np.full(5, 1 + growth_rate))
+    inv_discount = np.cumprod(np.full(5, 1 / (1 + wacc)))
+    fcf_forecast = fcf_raw.mean() * growth_factors
+    terminal_value = fcf_forecast[-1] * (1 + terminal_growth)
+    discounted_fcf_sum = float(np.dot(fcf_forecast, inv_discount))
+    discounted_terminal = terminal_value * inv_discount[-1]
+    enterprise_value = discounted_fcf_sum + discounted_terminal
+    equity_value = enterprise_value - net_debt
+    intrinsic_value = equity_value / shares_outstanding if shares_outstanding else 0
+    upside = ((intrinsic_value - market_price) / market_price) * 100
+    return (fcf_forecast, terminal_value, discounted_fcf_sum, discounted_terminal,
+            enterprise_value, equity_value, intrinsic_value, upside)
+
 # --- Custom CSS ---
-st.markdown("""
+@st.cache_resource
+def _css():
+    return """
     <style>
     #MainMenu {visibility: hidden;}
     header {visibility: hidden;}
@@ -56,6 +83,15 @@ st.markdown("""
 .metric-box:hover {
     background-color: #2b3a50; /* Sedikit lighten saat hover */
 }
+.metric-row {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 1rem;
+}
+.metric-row .metric-box {
+    flex: 1;
+    min-width: 220px;
+}
 
     .info-box {
         background-color: #2f3640;
@@ -87,7 +123,9 @@ st.markdown("""
         color: white;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(_css(), unsafe_allow_html=True)
 
 # --- Sidebar ---
 st.sidebar.image("logo.png", use_container_width=True)
@@ -99,261 +137,297 @@ country = st.sidebar.selectbox("Country", ["Indonesia"])
 
 submit = st.sidebar.button("Submit")
 
+# --- Charts and Tables ---
+DARK_LAYOUT = dict(plot_bgcolor='#050915', paper_bgcolor='#050915', font=dict(color='white'))
+
+def render_valuation_charts():
+    import plotly.graph_objects as go
+
+    dcf = st.session_state["dcf"]
+
+    # --- STOCK PERFORMANCE CHART ---
+    st.markdown("<hr style='border:1px solid #34495e;'>", unsafe_allow_html=True)
+    st.subheader("📈 Stock Performance (Last 5 Years)")
+    fig = go.Figure()
+    close = dcf["hist"]['Close']
+    close = close.groupby(close.index.tz_localize(None).to_period('W-FRI')).tail(1)
+    fig.add_trace(go.Scattergl(x=close.index, y=close.values, mode='lines', name='Close Price'))
+    fig.update_layout(
+        **DARK_LAYOUT,
+        xaxis_title='Date',
+        yaxis_title='Price',
+        hovermode='x unified',
+        margin=dict(l=30, r=30, t=50, b=30)
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    # --- FCF FORECASTING CHART ---
+    st.markdown("<hr style='border:1px solid #34495e;'>", unsafe_allow_html=True)
+    st.subheader("📈 FCF Forecasting")
+
+    fig2 = go.Figure()
+
+    fig2.add_trace(go.Bar(
+        x=dcf["years"],
+        y=dcf["fcf_raw"],
+        name='Historical FCF',
+        marker_color='#f39c12'
+    ))
+
+    fig2.add_trace(go.Bar(
+        x=dcf["forecast_years"],
+        y=dcf["fcf_forecast"],
+        name='Forecasted FCF',
+        marker_color='#3498db'
+    ))
+
+    fig2.add_trace(go.Scatter(
+        x=[dcf["forecast_years"][-1]+1],
+        y=[dcf["terminal_value"]],
+        mode='markers+text',
+        name='Terminal Value',
+        marker=dict(size=12, color='#fab1a0'),
+        text=['Terminal'],
+        textposition='top center'
+    ))
+
+    fig2.update_layout(
+        barmode='group',
+        margin=dict(l=20, r=20, t=30, b=20),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.12,
+            xanchor="center",
+            x=0.5,
+            font=dict(size=14)
+        ),
+        **DARK_LAYOUT,
+        xaxis_title='Year',
+        yaxis_title='FCF Value',
+        hovermode='x unified'
+    )
+    st.plotly_chart(fig2, use_container_width=True)
+
+    st.markdown(f"<div class='info-box'>📊 Historical free cash flow, after deducting capital expenditures from operations, is forecasted using machine learning, utilizing Random Forest models.</div>", unsafe_allow_html=True)
+
+    # --- WACC AND CAPITAL STRUCTURE ---
+    st.markdown("<hr style='border:1px solid #34495e;'>", unsafe_allow_html=True)
+    st.subheader("📊 Capital Structure")
+
+    fig_pie = go.Figure(data=[go.Pie(
+        labels=['Equity', 'Debt'],
+        values=[dcf["total_equity"], dcf["total_debt"]],
+        hole=0.4,
+        textinfo='percent',
+        insidetextorientation='horizontal'
+    )])
+    fig_pie.update_layout(
+        margin=dict(t=10, b=10, l=10, r=10),
+        width=350,
+        height=350,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.1,
+            xanchor="center",
+            x=0.5,
+            font=dict(size=14)
+        ),
+        **DARK_LAYOUT
+    )
+
+    col1, col2 = st.columns([1, 1.2])
+    with col1:
+        st.plotly_chart(fig_pie, use_container_width=True, config={"staticPlot": True, "displayModeBar": False})
+    with col2:
+        st.markdown("#### Capital Structure Summary")
+        df_structure = pd.DataFrame({
+            'Component': ['Equity', 'Debt', 'Assets'],
+            'Amount': [dcf["total_equity"], dcf["total_debt"], dcf["total_capital"]]
+        })
+        st.dataframe(df_structure.style.format({"Amount": "{:,.0f}"}), use_container_width=True)
+
+    # --- COST OF EQUITY TABLE ---
+    st.subheader("🧮 Cost of Equity")
+    st.table({
+        "Component": ["Risk-Free Rate", "Equity Risk Premium", "Country Risk Premium", "Final Cost of Equity"],
+        "Value": [f"{dcf['risk_free_rate']:.2f}%", "2.90%", "2.50%", f"{dcf['cost_of_equity']*100:.2f}%"]
+    })
+
+    # --- COST OF DEBT TABLE ---
+    st.subheader("🏦 Cost of Debt")
+    st.table({
+        "Component": ["Interest Expense", "Pretax Cost of Debt", "Effective Tax Rate", "After-Tax Cost of Debt"],
+        "Value": [f"{dcf['interest_expense']:,.0f}", f"{dcf['pretax_cod']:.2f}%", f"{dcf['tax_rate']*100:.2f}%", f"{dcf['after_tax_cod']:.2f}%"]
+    })
+
+    st.markdown(f"""
+    <div class='info-box'>
+    📚 The cost of equity and the country risk premium figures are sourced from NYU Stern's financial market database curated by Professor Aswath Damodaran. 
+    The after-tax cost of debt is computed by adjusting the pretax cost of debt based on the effective tax rate to accurately reflect the true cost of borrowing.
+    </div>
+    """, unsafe_allow_html=True)
+
+    # --- VALUATION TABLE ---
+    st.markdown("<hr style='border:1px solid #34495e;'>", unsafe_allow_html=True)
+    st.subheader("📈 Final DCF Valuation Result")
+    valuation_df = pd.DataFrame({
+        "Metric": [
+            "Discounted FCF (5 Years)",
+            "Discounted Terminal Value",
+            "Enterprise Value",
+            "Net Debt",
+            "Equity Value",
+            "Shares Outstanding",
+            "Intrinsic Value per Share"
+        ],
+        "Value": [
+            dcf["discounted_fcf_sum"],
+            dcf["discounted_terminal"],
+            dcf["enterprise_value"],
+            dcf["net_debt"],
+            dcf["equity_value"],
+            dcf["shares_outstanding"],
+            dcf["intrinsic_value"]
+        ]
+    })
+    st.dataframe(valuation_df.style.format({"Value": "{:,.0f}"}), use_container_width=True)
+
 # --- Main Program ---
+dcf_key = (ticker, risk_free_rate, country)
 if submit:
-    with st.spinner("Processing DCF Valuation..."):
-        stock = yf.Ticker(ticker)
-        market_price = stock.history(period="1d")["Close"].iloc[-1]
-        cashflow = stock.cashflow.fillna(0)
-        income_stmt = stock.financials.fillna(0)
-        balance_sheet = stock.balance_sheet.fillna(0)
-
-        def safe_get(df, label, default=0):
-            return df.loc[label].values[0] if label in df.index else default
-
-        # Free Cash Flow Forecast
-        fcf_line = 'Free Cash Flow'
-        if fcf_line in cashflow.index:
-            fcf_raw = cashflow.loc[fcf_line].head(4)[::-1]
-            years = [col.year for col in fcf_raw.index]
-            base_value = np.mean(fcf_raw.values)
-            forecast_years = [years[-1] + i for i in range(1, 6)]
+    if st.session_state.get("dcf_key") != dcf_key:
+        with st.spinner("Processing DCF Valuation..."):
+            hist = _hist(ticker, "5y")
+            market_price = hist["Close"].iloc[-1]
+            cashflow, income_stmt, balance_sheet = (df.fillna(0) for df in _statements(ticker))
+
+            def safe_get(df, label, default=0):
+                try:
+                    return df.iat[df.index.get_loc(label), 0]
+                except KeyError:
+                    return default
+
+            # Free Cash Flow Forecast
+            fcf_line = 'Free Cash Flow'
+            if fcf_line not in cashflow.index or not cashflow.loc[fcf_line].head(4).any():
+                st.warning(f"Free Cash Flow data is not available for {ticker}, so the DCF Valuation cannot be generated.")
+                st.session_state.pop("dcf", None)
+                st.session_state.pop("dcf_key", None)
+                st.stop()
+            fcf_row = cashflow.loc[fcf_line]
+            fcf_raw = fcf_row.values[:4][::-1]
+            years = list(pd.DatetimeIndex(fcf_row.index[:4][::-1]).year)
+            forecast_years = years[-1] + np.arange(1, 6)
             growth_rate = 0.17
-            fcf_forecast = [base_value * (1 + growth_rate) ** i for i in range(1, 6)]
-            terminal_value = fcf_forecast[-1] * 1.03
-        else:
-            fcf_forecast = [0] * 5
-            terminal_value = 0
-
-        # CAGR Calculation
-        fcf_cagr = ((fcf_forecast[-1] / fcf_raw.values[0]) ** (1/9)) - 1 if fcf_raw.values[0] else 0
-
-        # Capital Structure
-        total_equity = safe_get(balance_sheet, 'Total Equity Gross Minority Interest')
-        total_debt = safe_get(balance_sheet, 'Total Debt')
-        cash = safe_get(balance_sheet, 'Cash And Cash Equivalents')
-        net_debt = total_debt - cash
-        shares_outstanding = safe_get(balance_sheet, 'Ordinary Shares Number')
-
-        # Cost of Debt
-        interest_expense = safe_get(income_stmt, 'Interest Expense')
-        tax_rate = safe_get(income_stmt, 'Tax Rate For Calcs', default=0.241)
-        pretax_cod = (interest_expense / total_debt * 100) if interest_expense and total_debt else 5
-        after_tax_cod = pretax_cod * (1 - tax_rate)
-
-        # Cost of Equity
-        equity_risk_premium = 2.9 / 100
-        country_risk_premium = 2.5 / 100
-        cost_of_equity = (risk_free_rate/100) + equity_risk_premium + country_risk_premium
-
-        # WACC
-        total_capital = total_equity + total_debt
-        equity_weight = total_equity / total_capital if total_capital else 0
-        debt_weight = total_debt / total_capital if total_capital else 0
-        wacc = (equity_weight * cost_of_equity) + (debt_weight * after_tax_cod / 100) if total_capital else 0.1
-
-        # DCF Valuation
-        discount_factors = [(1 + wacc) ** i for i in range(1, 6)]
-        discounted_fcfs = np.array(fcf_forecast) / discount_factors
-        discounted_terminal = terminal_value / ((1 + wacc) ** 5)
-        enterprise_value = np.sum(discounted_fcfs) + discounted_terminal
-        equity_value = enterprise_value - net_debt
-        intrinsic_value = equity_value / shares_outstanding if shares_outstanding else 0
-        upside = ((intrinsic_value - market_price) / market_price) * 100
-
-        # --- TITLE ---
-        st.title("📊 DCF Valuation Analysis")
-        st.markdown("<hr style='margin-top:0; margin-bottom:2.5rem; border:1px solid #34495e;'>", unsafe_allow_html=True)
-
-        # --- METRIC BOXES ---
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.markdown(f"<div class='metric-box'>📈 Market Price<br>{market_price:,.2f}</div>", unsafe_allow_html=True)
-        with col2:
-            st.markdown(f"<div class='metric-box'>📊 CAGR FCF<br>{fcf_cagr*100:.2f}%</div>", unsafe_allow_html=True)
-        with col3:
-            st.markdown(f"<div class='metric-box'>🏦 WACC<br>{wacc*100:.2f}%</div>", unsafe_allow_html=True)
-
-        # --- INFO BOX BELOW THE METRIC BOXES ---
-        st.markdown(f"""
-        <div class='info-box'>💡 The Discounted Cash Flow (DCF) model is best suited for companies with stable growth and consistent free cash flow. It provides the most accurate intrinsic value for such firms. For companies like banks, which have fluctuating cash flows and dividend-based valuation, the Dividend Discount Model (DDM) is more appropriate. Stay tuned for the DDM model (coming soon).</div>
-        """, unsafe_allow_html=True)
-
-        # --- STOCK PERFORMANCE CHART ---
-        st.markdown("<hr style='border:1px solid #34495e;'>", unsafe_allow_html=True)
-        st.subheader("📈 Stock Performance (Last 5 Years)")
-        hist = stock.history(period="5y")
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=hist.index, y=hist['Close'], mode='lines', name='Close Price'))
-        fig.update_layout(
-            plot_bgcolor='#050915', 
-            paper_bgcolor='#050915', 
-            font=dict(color='white'),
-            xaxis_title='Date',
-            yaxis_title='Price',
-            hovermode='x unified',
-            margin=dict(l=30, r=30, t=50, b=30)
-        )
-        st.plotly_chart(fig, use_container_width=True)
-
-        # --- FCF FORECASTING CHART ---
-        st.markdown("<hr style='border:1px solid #34495e;'>", unsafe_allow_html=True)
-        st.subheader("📈 FCF Forecasting")
-
-        fig2 = go.Figure()
-
-        fig2.add_trace(go.Bar(
-            x=years,
-            y=fcf_raw.values,
-            name='Historical FCF',
-            marker_color='#f39c12'
-        ))
-
-        fig2.add_trace(go.Bar(
-            x=forecast_years,
-            y=fcf_forecast,
-            name='Forecasted FCF',
-            marker_color='#3498db'
-        ))
-
-        fig2.add_trace(go.Scatter(
-            x=[forecast_years[-1]+1],
-            y=[terminal_value],
-            mode='markers+text',
-            name='Terminal Value',
-            marker=dict(size=12, color='#fab1a0'),
-            text=['Terminal'],
-            textposition='top center'
-        ))
-
-        fig2.update_layout(
-            barmode='group',
-            margin=dict(l=20, r=20, t=30, b=20),
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.12,
-                xanchor="center",
-                x=0.5,
-                font=dict(size=14)
-            ),
-            plot_bgcolor='#050915',
-            paper_bgcolor='#050915',
-            font=dict(color='white'),
-            xaxis_title='Year',
-            yaxis_title='FCF Value',
-            hovermode='x unified'
-        )
-        st.plotly_chart(fig2, use_container_width=True)
-
-        st.markdown(f"<div class='info-box'>📊 Historical free cash flow, after deducting capital expenditures from operations, is forecasted using machine learning, utilizing Random Forest models.</div>", unsafe_allow_html=True)
-
-        # --- WACC AND CAPITAL STRUCTURE ---
-        st.markdown("<hr style='border:1px solid #34495e;'>", unsafe_allow_html=True)
-        st.subheader("📊 Capital Structure")
-
-        fig_pie = go.Figure(data=[go.Pie(
-            labels=['Equity', 'Debt'],
-            values=[total_equity, total_debt],
-            hole=0.4,
-            textinfo='percent',
-            insidetextorientation='horizontal'
-        )])
-        fig_pie.update_layout(
-            margin=dict(t=10, b=10, l=10, r=10),
-            width=350,
-            height=350,
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.1,
-                xanchor="center",
-                x=0.5,
-                font=dict(size=14)
-            ),
-            plot_bgcolor='#050915',
-            paper_bgcolor='#050915',
-            font=dict(color='white')
-        )
-
-        col1, col2 = st.columns([1, 1.2])
-        with col1:
-            st.plotly_chart(fig_pie, use_container_width=True, config={"displayModeBar": False})
-        with col2:
-            st.markdown("#### Capital Structure Summary")
-            df_structure = pd.DataFrame({
-                'Component': ['Equity', 'Debt', 'Assets'],
-                'Amount': [total_equity, total_debt, total_capital]
-            })
-            df_structure['Amount'] = df_structure['Amount'].apply(lambda x: f"{x:,.0f}")
-            st.dataframe(df_structure, use_container_width=True)
-
-        # --- COST OF EQUITY TABLE ---
-        st.subheader("🧮 Cost of Equity")
-        coe_data = pd.DataFrame({
-            "Component": ["Risk-Free Rate", "Equity Risk Premium", "Country Risk Premium", "Final Cost of Equity"],
-            "Value": [f"{risk_free_rate:.2f}%", "2.90%", "2.50%", f"{cost_of_equity*100:.2f}%"]
-        })
-        st.dataframe(coe_data, use_container_width=True)
-
-        # --- COST OF DEBT TABLE ---
-        st.subheader("🏦 Cost of Debt")
-        cod_data = pd.DataFrame({
-            "Component": ["Interest Expense", "Pretax Cost of Debt", "Effective Tax Rate", "After-Tax Cost of Debt"],
-            "Value": [f"{interest_expense:,.0f}", f"{pretax_cod:.2f}%", f"{tax_rate*100:.2f}%", f"{after_tax_cod:.2f}%"]
-        })
-        st.dataframe(cod_data, use_container_width=True)
-
-        st.markdown(f"""
-        <div class='info-box'>
-        📚 The cost of equity and the country risk premium figures are sourced from NYU Stern's financial market database curated by Professor Aswath Damodaran. 
-        The after-tax cost of debt is computed by adjusting the pretax cost of debt based on the effective tax rate to accurately reflect the true cost of borrowing.
-        </div>
-        """, unsafe_allow_html=True)
-
-        # --- VALUATION TABLE ---
-        st.markdown("<hr style='border:1px solid #34495e;'>", unsafe_allow_html=True)
-        st.subheader("📈 Final DCF Valuation Result")
-        valuation_df = pd.DataFrame({
-            "Metric": [
-                "Discounted FCF (5 Years)",
-                "Discounted Terminal Value",
-                "Enterprise Value",
-                "Net Debt",
-                "Equity Value",
-                "Shares Outstanding",
-                "Intrinsic Value per Share"
-            ],
-            "Value": [
-                np.sum(discounted_fcfs),
-                discounted_terminal,
-                enterprise_value,
-                net_debt,
-                equity_value,
-                shares_outstanding,
-                intrinsic_value
-            ]
-        })
-        valuation_df['Value'] = valuation_df['Value'].apply(lambda x: f"{x:,.0f}" if isinstance(x, (int, float)) else x)
-        st.dataframe(valuation_df, use_container_width=True)
-
-        # --- FINAL UPSIDE/DOWNSIDE METRIC BOXES ---
-        st.markdown("<hr style='border:1px solid #34495e;'>", unsafe_allow_html=True)
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.markdown(f"<div class='metric-box'>📈 Market Price<br>{market_price:,.2f}</div>", unsafe_allow_html=True)
-        with col2:
-            st.markdown(f"<div class='metric-box'>🎯 Intrinsic Value<br>{intrinsic_value:,.2f}</div>", unsafe_allow_html=True)
-        with col3:
-            if upside >= 0:
-                st.markdown(f"<div class='metric-box'>📈 Upside Potential<br>+{upside:.2f}%</div>", unsafe_allow_html=True)
-            else:
-                st.markdown(f"<div class='metric-box'>📉 Downside Risk<br>{upside:.2f}%</div>", unsafe_allow_html=True)
-
-        # --- DISCLAIMER AND FOOTER ---
-        st.markdown("<hr style='border:1px solid #34495e;'>", unsafe_allow_html=True)
-        st.markdown(f"<div class='info-box'>⚠️ This tool is for educational purposes only. Please perform your own analysis or consult a financial advisor before making investment decisions.</div>", unsafe_allow_html=True)
-        st.markdown("<div class='footer-text'>Created by Abida Massi</div>", unsafe_allow_html=True)
+            terminal_growth = 0.03
+
+            # Capital Structure
+            total_equity = safe_get(balance_sheet, 'Total Equity Gross Minority Interest')
+            total_debt = safe_get(balance_sheet, 'Total Debt')
+            cash = safe_get(balance_sheet, 'Cash And Cash Equivalents')
+            net_debt = total_debt - cash
+            shares_outstanding = safe_get(balance_sheet, 'Ordinary Shares Number')
+
+            # Cost of Debt
+            interest_expense = safe_get(income_stmt, 'Interest Expense')
+            tax_rate = safe_get(income_stmt, 'Tax Rate For Calcs', default=0.241)
+            pretax_cod = (interest_expense / total_debt * 100) if interest_expense and total_debt else 5
+            after_tax_cod = pretax_cod * (1 - tax_rate)
+
+            # Cost of Equity
+            equity_risk_premium = 2.9 / 100
+            country_risk_premium = 2.5 / 100
+            cost_of_equity = (risk_free_rate/100) + equity_risk_premium + country_risk_premium
+
+            # WACC
+            total_capital = total_equity + total_debt
+            equity_weight = total_equity / total_capital if total_capital else 0
+            debt_weight = total_debt / total_capital if total_capital else 0
+            wacc = (equity_weight * cost_of_equity) + (debt_weight * after_tax_cod / 100) if total_capital else 0.1
+
+            # DCF Valuation
+            (fcf_forecast, terminal_value, discounted_fcf_sum, discounted_terminal,
+             enterprise_value, equity_value, intrinsic_value, upside) = dcf_core(
+                fcf_raw, wacc, growth_rate, terminal_growth, net_debt, shares_outstanding, market_price
+            )
+
+            # CAGR Calculation
+            fcf_cagr = ((fcf_forecast[-1] / fcf_raw[0]) ** (1/9)) - 1 if fcf_raw[0] else 0
+
+            # --- Store results for rendering ---
+            st.session_state["dcf"] = {
+                "hist": hist,
+                "market_price": market_price,
+                "years": years,
+                "fcf_raw": fcf_raw,
+                "forecast_years": forecast_years,
+                "fcf_forecast": fcf_forecast,
+                "terminal_value": terminal_value,
+                "fcf_cagr": fcf_cagr,
+                "total_equity": total_equity,
+                "total_debt": total_debt,
+                "total_capital": total_capital,
+                "net_debt": net_debt,
+                "shares_outstanding": shares_outstanding,
+                "interest_expense": interest_expense,
+                "tax_rate": tax_rate,
+                "pretax_cod": pretax_cod,
+                "after_tax_cod": after_tax_cod,
+                "cost_of_equity": cost_of_equity,
+                "risk_free_rate": risk_free_rate,
+                "wacc": wacc,
+                "discounted_fcf_sum": discounted_fcf_sum,
+                "discounted_terminal": discounted_terminal,
+                "enterprise_value": enterprise_value,
+                "equity_value": equity_value,
+                "intrinsic_value": intrinsic_value,
+                "upside": upside,
+            }
+            st.session_state["dcf_key"] = dcf_key
+
+if st.session_state.get("dcf_key") == dcf_key:
+    dcf = st.session_state["dcf"]
+
+    # --- TITLE ---
+    st.title("📊 DCF Valuation Analysis")
+    st.markdown("<hr style='margin-top:0; margin-bottom:2.5rem; border:1px solid #34495e;'>", unsafe_allow_html=True)
+
+    # --- METRIC BOXES ---
+    st.markdown(f"""
+    <div class='metric-row'>
+    <div class='metric-box'>📈 Market Price<br>{dcf['market_price']:,.2f}</div>
+    <div class='metric-box'>📊 CAGR FCF<br>{dcf['fcf_cagr']*100:.2f}%</div>
+    <div class='metric-box'>🏦 WACC<br>{dcf['wacc']*100:.2f}%</div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # --- INFO BOX BELOW THE METRIC BOXES ---
+    st.markdown(f"""
+    <div class='info-box'>💡 The Discounted Cash Flow (DCF) model is best suited for companies with stable growth and consistent free cash flow. It provides the most accurate intrinsic value for such firms. For companies like banks, which have fluctuating cash flows and dividend-based valuation, the Dividend Discount Model (DDM) is more appropriate. Stay tuned for the DDM model (coming soon).</div>
+    """, unsafe_allow_html=True)
+
+    render_valuation_charts()
+
+    # --- FINAL UPSIDE/DOWNSIDE METRIC BOXES ---
+    st.markdown("<hr style='border:1px solid #34495e;'>", unsafe_allow_html=True)
+    if dcf["upside"] >= 0:
+        upside_box = f"<div class='metric-box'>📈 Upside Potential<br>+{dcf['upside']:.2f}%</div>"
+    else:
+        upside_box = f"<div class='metric-box'>📉 Downside Risk<br>{dcf['upside']:.2f}%</div>"
+    st.markdown(f"""
+    <div class='metric-row'>
+    <div class='metric-box'>📈 Market Price<br>{dcf['market_price']:,.2f}</div>
+    <div class='metric-box'>🎯 Intrinsic Value<br>{dcf['intrinsic_value']:,.2f}</div>
+    {upside_box}
+    </div>
+    """, unsafe_allow_html=True)
+
+    # --- DISCLAIMER AND FOOTER ---
+    st.markdown("<hr style='border:1px solid #34495e;'>", unsafe_allow_html=True)
+    st.markdown(f"<div class='info-box'>⚠️ This tool is for educational purposes only. Please perform your own analysis or consult a financial advisor before making investment decisions.</div>", unsafe_allow_html=True)
+    st.markdown("<div class='footer-text'>Created by Abida Massi</div>", unsafe_allow_html=True)
 
 else:
     st.info("Please input parameters and click Submit to generate DCF Valuation.")